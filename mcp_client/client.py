@@ -1,21 +1,89 @@
 """MCP Client - Interactive client for testing MCP servers with Claude."""
 
+import argparse
 import asyncio
+import json
 import os
-import sys
+import time
 from contextlib import AsyncExitStack
 from pathlib import Path
 
+import httpx
 from anthropic import Anthropic
 from dotenv import load_dotenv
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+try:
+    # Optional: uvloop is a drop-in event loop with lower per-op syscall
+    # cost, which helps the stdio traffic between client and MCP server.
+    # Install with the "perf" extra.
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 load_dotenv()  # load environment variables from .env
 
 # Claude model constant
 ANTHROPIC_MODEL = "claude-sonnet-4-5"
 
+# Abort a stream if no event arrives for this many seconds. Enforced as
+# the httpx read timeout, which can interrupt a socket that is actually
+# blocked; the other phases keep the SDK's usual generous limits.
+STREAM_STALL_TIMEOUT = 30.0
+_STREAM_TIMEOUT = httpx.Timeout(600.0, connect=5.0, read=STREAM_STALL_TIMEOUT)
+
+# Placeholder schema sent instead of each tool's full inputSchema. Shipping
+# every schema on every API turn wastes prompt tokens; Claude can fetch the
+# real schema on demand with the get_schema meta-tool below.
+_BRIEF_SCHEMA = {"type": "object", "properties": {}, "additionalProperties": True}
+
+# Launch command for each supported server script type, keyed by extension
+_LAUNCHERS = {
+    ".py": lambda p: ["uv", "--directory", str(p.parent.parent), "run", "python", str(p)],
+    ".js": lambda p: ["node", str(p)],
+}
+
+_GET_SCHEMA_TOOL = {
+    "name": "get_schema",
+    "description": (
+        "Get the full JSON input schema for one of the other tools. "
+        "Call this first if you are unsure what arguments a tool takes."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "tool_name": {
+                "type": "string",
+                "description": "Name of the tool to describe"
+            }
+        },
+        "required": ["tool_name"]
+    }
+}
+
+
+def _extract_text(content) -> str:
+    """Flatten MCP tool-result content into a single string.
+
+    Content may be a plain value or a list of content blocks (objects with
+    a .text attribute or dicts with a 'text' key). Collecting the pieces
+    and joining once avoids the quadratic cost of growing a string with +=
+    when a result has many blocks.
+    """
+    if isinstance(content, list):
+        parts = []
+        for item in content:
+            if hasattr(item, "text"):
+                parts.append(item.text)
+            elif isinstance(item, dict) and "text" in item:
+                parts.append(item["text"])
+            else:
+                parts.append(str(item))
+        return "".join(parts)
+    return str(content)
+
 
 class MCPClient:
     """Client for interacting with MCP servers through Claude."""
@@ -25,6 +93,9 @@ class MCPClient:
         self.session: ClientSession | None = None
         self.exit_stack = AsyncExitStack()
         self._anthropic: Anthropic | None = None
+        self._tools_cache: tuple[dict, ...] | None = None
+        self._tools_cache_ts: float = 0.0
+        self._tools_full: dict[str, dict] = {}
 
     @property
     def anthropic(self) -> Anthropic:
@@ -33,30 +104,94 @@ class MCPClient:
             self._anthropic = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
         return self._anthropic
 
+    def _stream_message(self, messages: list, tools: list):
+        """Stream a Claude response, printing text as it arrives.
+
+        Returns the fully assembled message once the stream completes.
+        The read timeout aborts the request if the stream goes more than
+        STREAM_STALL_TIMEOUT seconds without delivering anything, instead
+        of blocking in the iterator forever.
+        """
+        with self.anthropic.messages.stream(
+            model=ANTHROPIC_MODEL,
+            max_tokens=4000,
+            messages=messages,
+            tools=tools,
+            timeout=_STREAM_TIMEOUT
+        ) as stream:
+            for event in stream:
+                if event.type == "text":
+                    print(event.text, end="", flush=True)
+            print()
+            return stream.get_final_message()
+
+    async def _create_message(self, messages: list, tools: list):
+        """Stream a Claude API call in a worker thread so the event loop stays free."""
+        return await asyncio.to_thread(self._stream_message, messages, tools)
+
+    async def _get_tools(self, ttl: float = 300.0) -> tuple[dict, ...]:
+        """Return the server's tools in Anthropic format, cached with a TTL.
+
+        The tool list rarely changes within a session, so re-fetching it on
+        every query just re-pays an RPC round-trip. The cache expires after
+        `ttl` seconds in case the server's tools do change.
+
+        Tools are sent with placeholder schemas plus a get_schema meta-tool;
+        the full schemas stay in self._tools_full and are only shipped to
+        Claude when it asks for one.
+        """
+        now = time.monotonic()
+        if self._tools_cache is not None and now - self._tools_cache_ts < ttl:
+            return self._tools_cache
+
+        response = await self.session.list_tools()
+        self._tools_full = {tool.name: tool.inputSchema for tool in response.tools}
+        tools = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": _BRIEF_SCHEMA
+            }
+            for tool in response.tools
+        ]
+        # Prompt-cache breakpoint on the final tool definition: Anthropic
+        # caches the prompt prefix up to this marker, so the tool block is
+        # only tokenized on the first turn of a conversation
+        tools.append({**_GET_SCHEMA_TOOL, "cache_control": {"type": "ephemeral"}})
+        # Freeze the payload: every messages call gets the same tuple, so no
+        # per-turn dict rebuilds and no accidental mutation between turns
+        self._tools_cache = tuple(tools)
+        self._tools_cache_ts = now
+        return self._tools_cache
+
+    async def _call_tool(self, tool_use):
+        """Execute one tool_use block, answering get_schema locally.
+
+        get_schema never hits the MCP server - its answer is already cached
+        in self._tools_full - so it returns a plain string instead of a
+        CallToolResult.
+        """
+        if tool_use.name == "get_schema":
+            tool_name = tool_use.input.get("tool_name", "")
+            schema = self._tools_full.get(tool_name)
+            if schema is None:
+                return f"Unknown tool: '{tool_name}'"
+            return json.dumps(schema)
+        return await self.session.call_tool(tool_use.name, tool_use.input)
+
     async def connect_to_server(self, server_script_path: str):
         """Connect to an MCP server.
 
         Args:
             server_script_path: Path to the server script (.py or .js)
         """
-        is_python = server_script_path.endswith(".py")
-        is_js = server_script_path.endswith(".js")
-        if not (is_python or is_js):
+        path = Path(server_script_path).resolve()
+        launcher = _LAUNCHERS.get(path.suffix)
+        if launcher is None:
             raise ValueError("Server script must be a .py or .js file")
 
-        if is_python:
-            path = Path(server_script_path).resolve()
-            server_params = StdioServerParameters(
-                command="uv",
-                args=["--directory", str(path.parent.parent), "run", "python", str(path)],
-                env=None,
-            )
-        else:
-            server_params = StdioServerParameters(
-                command="node",
-                args=[server_script_path],
-                env=None
-            )
+        command, *args = launcher(path)
+        server_params = StdioServerParameters(command=command, args=args, env=None)
 
         stdio_transport = await self.exit_stack.enter_async_context(stdio_client(server_params))
         self.stdio, self.write = stdio_transport
@@ -64,46 +199,40 @@ class MCPClient:
 
         await self.session.initialize()
 
-        # List available tools
-        response = await self.session.list_tools()
-        tools = response.tools
-        print("\nConnected to server with tools:", [tool.name for tool in tools])
+        # Warm the tool cache; process_query reuses it without another RPC
+        await self._get_tools()
+        print("\nConnected to server with tools:", list(self._tools_full))
 
     async def process_query(self, query: str) -> str:
-        """Process a query using Claude and available tools."""
+        """Process a query using Claude and available tools.
+
+        Output is printed as it happens - text streams from
+        _stream_message and tool-call markers print inline - so callers
+        should not print the returned transcript again.
+        """
         messages = [{"role": "user", "content": query}]
 
-        response = await self.session.list_tools()
-        available_tools = [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.inputSchema
-            }
-            for tool in response.tools
-        ]
+        available_tools = await self._get_tools()
 
         # Initial Claude API call
-        response = self.anthropic.messages.create(
-            model=ANTHROPIC_MODEL,
-            max_tokens=4000,
-            messages=messages,
-            tools=available_tools
-        )
+        response = await self._create_message(messages, available_tools)
 
         # Process response and handle tool calls in a loop
         final_text = []
         
         # Keep processing until no more tool calls
         while True:
-            # Check if response contains tool calls
-            tool_uses = [block for block in response.content if block.type == "tool_use"]
-            
+            # Split the content in one pass: gather tool calls and collect
+            # any interleaved text as it appears
+            tool_uses = []
+            for block in response.content:
+                if block.type == "tool_use":
+                    tool_uses.append(block)
+                elif block.type == "text":
+                    final_text.append(block.text)
+
             if not tool_uses:
-                # No more tool calls, extract final text and break
-                for content in response.content:
-                    if content.type == "text":
-                        final_text.append(content.text)
+                # Claude is done - no extra API round-trip needed
                 break
             
             # Add assistant's response with tool calls to conversation
@@ -112,36 +241,35 @@ class MCPClient:
                 "content": response.content
             })
             
-            # Execute all tool calls and collect results
-            tool_results = []
+            # Execute all tool calls concurrently - they are independent RPCs,
+            # so the tool phase costs max(latency) instead of the sum.
+            # gather preserves input order, keeping tool_results aligned with
+            # the tool_use ids Claude expects.
             for tool_use in tool_uses:
-                tool_name = tool_use.name
-                tool_args = tool_use.input
-                
-                # Execute tool call
-                result = await self.session.call_tool(tool_name, tool_args)
-                final_text.append(f"[Calling tool {tool_name} with args {tool_args}]")
-                
-                # Extract content from result - handle both string and list formats
-                if isinstance(result.content, list):
-                    # If it's a list of content blocks, extract text
-                    content_text = ""
-                    for item in result.content:
-                        if hasattr(item, 'text'):
-                            content_text += item.text
-                        elif isinstance(item, dict) and 'text' in item:
-                            content_text += item['text']
-                        else:
-                            content_text += str(item)
-                    result_content = content_text
-                else:
-                    result_content = str(result.content)
-                
+                marker = f"[Calling tool {tool_use.name} with args {tool_use.input}]"
+                print(marker)
+                final_text.append(marker)
+
+            results = await asyncio.gather(
+                *(self._call_tool(tu) for tu in tool_uses)
+            )
+
+            tool_results = []
+            for tool_use, result in zip(tool_uses, results):
+                # get_schema is answered locally and yields a plain string
+                if isinstance(result, str):
+                    tool_results.append({
+                        "type": "tool_result",
+                        "tool_use_id": tool_use.id,
+                        "content": result
+                    })
+                    continue
+
                 # Collect tool result
                 tool_results.append({
                     "type": "tool_result",
                     "tool_use_id": tool_use.id,
-                    "content": result_content
+                    "content": _extract_text(result.content)
                 })
             
             # Add tool results as user message
@@ -151,12 +279,7 @@ class MCPClient:
             })
             
             # Get Claude's next response after processing tool results
-            response = self.anthropic.messages.create(
-                model=ANTHROPIC_MODEL,
-                max_tokens=4000,
-                messages=messages,
-                tools=available_tools
-            )
+            response = await self._create_message(messages, available_tools)
 
         return "\n".join(final_text)
 
@@ -176,7 +299,9 @@ class MCPClient:
 
         while True:
             try:
-                query = input("\nQuery: ").strip()
+                # Read input in a worker thread so the event loop keeps
+                # servicing the MCP session while the user types
+                query = (await asyncio.to_thread(input, "\nQuery: ")).strip()
 
                 if query.lower() == "quit":
                     break
@@ -184,8 +309,9 @@ class MCPClient:
                 if not query:
                     continue
 
-                response = await self.process_query(query)
-                print("\n" + response)
+                # process_query prints as it streams; re-printing the
+                # returned transcript would show every reply twice
+                await self.process_query(query)
 
             except KeyboardInterrupt:
                 print("\nExiting...")
@@ -200,15 +326,18 @@ class MCPClient:
 
 async def main():
     """Main entry point for the MCP client."""
-    if len(sys.argv) < 2:
-        print("Usage: python mcp_client/client.py <path_to_server_script>")
-        print("\nExample:")
-        print("  python mcp_client/client.py mcp_server/server.py")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Interactive MCP client for testing MCP servers with Claude."
+    )
+    parser.add_argument(
+        "server_script",
+        help="Path to the server script (.py or .js), e.g. mcp_server/server.py"
+    )
+    args = parser.parse_args()
 
     client = MCPClient()
     try:
-        await client.connect_to_server(sys.argv[1])
+        await client.connect_to_server(args.server_script)
 
         # Check if we have a valid API key to continue
         api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -2,6 +2,8 @@
 
 import asyncio
 import os
+
+import httpx
 from anthropic import Anthropic
 from dotenv import load_dotenv
 from mcp import ClientSession
@@ -11,6 +13,46 @@ load_dotenv()
 # Claude model
 ANTHROPIC_MODEL = "claude-sonnet-4-5"
 
+# Abort a stream if no event arrives for this many seconds. Enforced as
+# the httpx read timeout, which can interrupt a socket that is actually
+# blocked; the other phases keep the SDK's usual generous limits.
+STREAM_STALL_TIMEOUT = 30.0
+_STREAM_TIMEOUT = httpx.Timeout(600.0, connect=5.0, read=STREAM_STALL_TIMEOUT)
+
+
+def _stream_message(anthropic: Anthropic, messages: list, tools: list):
+    """Stream a Claude response, printing text as it arrives.
+
+    Streaming means we see tokens as Claude generates them instead of
+    waiting for the whole response, and the read timeout aborts a stream
+    that goes more than STREAM_STALL_TIMEOUT seconds without delivering
+    anything instead of hanging forever.
+    """
+    with anthropic.messages.stream(
+        model=ANTHROPIC_MODEL,
+        max_tokens=4000,
+        messages=messages,
+        tools=tools,
+        timeout=_STREAM_TIMEOUT
+    ) as stream:
+        for event in stream:
+            if event.type == "text":
+                print(event.text, end="", flush=True)
+        print()
+        return stream.get_final_message()
+
+
+def _extract_text(content) -> str:
+    """Flatten MCP tool-result content into a single string.
+
+    Content may be a plain value or a list of content blocks with a .text
+    attribute. Collecting the pieces and joining once avoids the quadratic
+    cost of growing a string with += when a result has many blocks.
+    """
+    if isinstance(content, list):
+        return "".join(item.text for item in content if hasattr(item, "text"))
+    return str(content)
+
 
 async def process_query(session: ClientSession, anthropic: Anthropic, query: str) -> str:
     """Process a query using Claude and available MCP tools.
@@ -43,26 +85,25 @@ async def process_query(session: ClientSession, anthropic: Anthropic, query: str
         for tool in response.tools
     ]
     
-    # Initial Claude API call with tools
-    response = anthropic.messages.create(
-        model=ANTHROPIC_MODEL,
-        max_tokens=4000,
-        messages=messages,
-        tools=available_tools
-    )
+    # Initial Claude API call with tools (streamed in a worker thread so
+    # the event loop stays free while tokens arrive)
+    response = await asyncio.to_thread(_stream_message, anthropic, messages, available_tools)
     
     # Agentic loop: keep processing until no more tool calls
     final_text = []
     
     while True:
-        # Check if Claude wants to use any tools
-        tool_uses = [block for block in response.content if block.type == "tool_use"]
-        
+        # Split the content in one pass: gather tool calls and collect
+        # any interleaved text as it appears
+        tool_uses = []
+        for block in response.content:
+            if block.type == "tool_use":
+                tool_uses.append(block)
+            elif block.type == "text":
+                final_text.append(block.text)
+
         if not tool_uses:
-            # No more tools to call - extract final answer and exit
-            for content in response.content:
-                if content.type == "text":
-                    final_text.append(content.text)
+            # Claude is done - no extra API round-trip needed
             break
         
         # Add Claude's response (with tool calls) to conversation
@@ -71,31 +112,23 @@ async def process_query(session: ClientSession, anthropic: Anthropic, query: str
             "content": response.content
         })
         
-        # Execute all requested tools
-        tool_results = []
+        # Execute all requested tools concurrently - they are independent
+        # RPCs, so N tool calls cost max(latency) instead of the sum.
+        # gather preserves input order, keeping results aligned with tool_uses.
         for tool_use in tool_uses:
-            tool_name = tool_use.name
-            tool_args = tool_use.input
-            
-            print(f"[Executing {tool_name} with {tool_args}]")
-            
-            # Call the MCP tool
-            result = await session.call_tool(tool_name, tool_args)
-            
-            # Extract text content from result
-            result_text = ""
-            if isinstance(result.content, list):
-                for item in result.content:
-                    if hasattr(item, 'text'):
-                        result_text += item.text
-            else:
-                result_text = str(result.content)
-            
+            print(f"[Executing {tool_use.name} with {tool_use.input}]")
+
+        results = await asyncio.gather(
+            *(session.call_tool(tu.name, tu.input) for tu in tool_uses)
+        )
+
+        tool_results = []
+        for tool_use, result in zip(tool_uses, results):
             # Collect tool result with its ID
             tool_results.append({
                 "type": "tool_result",
                 "tool_use_id": tool_use.id,
-                "content": result_text
+                "content": _extract_text(result.content)
             })
         
         # Send tool results back to Claude as a user message
@@ -105,12 +138,7 @@ async def process_query(session: ClientSession, anthropic: Anthropic, query: str
         })
         
         # Get Claude's next response (might have more tool calls or final answer)
-        response = anthropic.messages.create(
-            model=ANTHROPIC_MODEL,
-            max_tokens=4000,
-            messages=messages,
-            tools=available_tools
-        )
+        response = await asyncio.to_thread(_stream_message, anthropic, messages, available_tools)
     
     return "\n".join(final_text)
 
@@ -1,10 +1,13 @@
 """MCP Server for Todo Application - provides tools for AI agents to manage todos."""
 
+import asyncio
+import atexit
 from typing import Any
 from datetime import datetime
 
 import httpx
 from mcp.server.fastmcp import FastMCP
+from mcp.types import TextContent
 
 # Initialize FastMCP server
 mcp = FastMCP("todo-manager")
@@ -13,43 +16,90 @@ mcp = FastMCP("todo-manager")
 TODO_API_BASE = "http://localhost:8000/api"
 DEFAULT_TIMEOUT = 30.0
 
+# C-speed JSON decoding; accepts the raw response bytes directly
+from orjson import loads as _loads
+
+try:
+    # Optional: C-speed ISO-8601 parsing (install with the "perf" extra)
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:
+    # fromisoformat accepts the trailing "Z" natively on Python 3.11+,
+    # so no per-call .replace() allocation is needed
+    _parse_dt = datetime.fromisoformat
+
+# Valid priority levels, hoisted so each tool call does an O(1) set lookup
+# instead of rebuilding a list literal
+VALID_PRIORITIES = frozenset(("low", "medium", "high", "urgent"))
+
+# Display forms precomputed once; a 4-entry lookup replaces an .upper()
+# call per formatted row
+_PRIO_DISPLAY = {p: p.upper() for p in VALID_PRIORITIES}
+_HEADER_RULE = "=" * 50
+_PRIORITY_ERROR = "Error: Invalid priority '{}'. Must be one of: low, medium, high, urgent"
+
+
+# Shared HTTP client so keep-alive connections are reused across tool calls
+# instead of paying a TCP handshake per request
+_http = httpx.AsyncClient(
+    base_url=TODO_API_BASE,
+    timeout=DEFAULT_TIMEOUT,
+    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+)
+
+
+def _close_http() -> None:
+    """Close the shared HTTP client when the server process exits."""
+    try:
+        asyncio.run(_http.aclose())
+    except RuntimeError:
+        pass  # event loop already gone; sockets are closed by the OS
+
+
+atexit.register(_close_http)
+
 
 async def make_api_request(
-    method: str, 
-    endpoint: str, 
+    method: str,
+    endpoint: str,
     json_data: dict[str, Any] | None = None,
     params: dict[str, Any] | None = None
-) -> dict[str, Any] | None:
-    """Make a request to the Todo API with proper error handling."""
-    url = f"{TODO_API_BASE}{endpoint}"
-    
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.request(
-                method=method,
-                url=url,
-                json=json_data,
-                params=params,
-                timeout=DEFAULT_TIMEOUT
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            return {"error": f"API request failed: {str(e)}"}
-        except Exception as e:
-            return {"error": f"Unexpected error: {str(e)}"}
+) -> tuple[bool, Any]:
+    """Make a request to the Todo API with proper error handling.
+
+    Returns (True, decoded payload) on success or (False, error message) on
+    failure, so callers branch on one flag instead of probing the payload
+    for an "error" key - which also removes the crash when the payload was
+    None.
+    """
+    try:
+        response = await _http.request(
+            method=method,
+            url=endpoint,
+            json=json_data,
+            params=params
+        )
+        # Branch on the status flag instead of raise_for_status(), keeping
+        # exception state off the success path and turning HTTP error
+        # statuses into plain returns
+        if response.is_success:
+            return True, _loads(response.content)
+        return False, f"HTTP {response.status_code}: {response.text}"
+    except httpx.HTTPError as e:
+        return False, f"API request failed: {str(e)}"
+    except Exception as e:
+        return False, f"Unexpected error: {str(e)}"
 
 
 def format_todo(todo: dict) -> str:
     """Format a todo item into a readable string."""
     completed_status = "✓ Completed" if todo.get("completed") else "○ Active"
-    created = datetime.fromisoformat(todo["created_at"].replace("Z", "+00:00"))
+    created = _parse_dt(todo["created_at"])
     
     result = f"""
 ID: {todo["id"]}
 Title: {todo["title"]}
 Status: {completed_status}
-Priority: {todo["priority"].upper()}
+Priority: {_PRIO_DISPLAY[todo["priority"]]}
 Created: {created.strftime("%Y-%m-%d %H:%M")}
 """
     
@@ -57,7 +107,7 @@ Created: {created.strftime("%Y-%m-%d %H:%M")}
         result += f"Description: {todo['description']}\n"
     
     if todo.get("completed_at"):
-        completed = datetime.fromisoformat(todo["completed_at"].replace("Z", "+00:00"))
+        completed = _parse_dt(todo["completed_at"])
         result += f"Completed: {completed.strftime('%Y-%m-%d %H:%M')}\n"
     
     return result.strip()
@@ -76,21 +126,21 @@ async def create_todo(
         description: Optional detailed description
         priority: Priority level - must be one of: low, medium, high, urgent (default: medium)
     """
-    if priority not in ["low", "medium", "high", "urgent"]:
-        return f"Error: Invalid priority '{priority}'. Must be one of: low, medium, high, urgent"
-    
+    if priority not in VALID_PRIORITIES:
+        return _PRIORITY_ERROR.format(priority)
+
     todo_data = {
         "title": title,
         "description": description,
         "priority": priority
     }
     
-    result = await make_api_request("POST", "/todos", json_data=todo_data)
-    
-    if result and "error" not in result:
+    ok, result = await make_api_request("POST", "/todos", json_data=todo_data)
+
+    if ok:
         return f"✓ Todo created successfully!\n{format_todo(result)}"
-    
-    return f"Failed to create todo: {result.get('error', 'Unknown error')}"
+
+    return f"Failed to create todo: {result}"
 
 
 @mcp.tool()
@@ -98,7 +148,7 @@ async def list_todos(
     priority: str | None = None,
     completed: bool | None = None,
     limit: int = 50
-) -> str:
+) -> list[TextContent]:
     """List todos with optional filters.
 
     Args:
@@ -107,29 +157,43 @@ async def list_todos(
         limit: Maximum number of todos to return (default: 50, max: 1000)
     """
     params = {"limit": min(limit, 1000)}
-    
+
     if priority:
-        if priority not in ["low", "medium", "high", "urgent"]:
-            return f"Error: Invalid priority '{priority}'. Must be one of: low, medium, high, urgent"
+        if priority not in VALID_PRIORITIES:
+            return [TextContent(type="text", text=_PRIORITY_ERROR.format(priority))]
         params["priority"] = priority
-    
+
     if completed is not None:
         params["completed"] = str(completed).lower()
-    
-    result = await make_api_request("GET", "/todos", params=params)
-    
-    if result and "error" not in result:
-        todos = result.get("todos", [])
-        total = result.get("total", 0)
-        
-        if not todos:
-            return "No todos found matching the criteria."
-        
-        formatted_todos = [format_todo(todo) for todo in todos]
-        header = f"Found {total} todo(s):\n" + "=" * 50 + "\n"
-        return header + "\n---\n".join(formatted_todos)
-    
-    return f"Failed to list todos: {result.get('error', 'Unknown error')}"
+
+    # Stream the response as NDJSON and format each todo as its line
+    # arrives, instead of buffering the whole JSON payload and then
+    # walking it a second time. One content block per todo keeps the
+    # result a list of small strings on both sides of the wire; clients
+    # that concatenate the blocks see the same text as before.
+    params["format"] = "ndjson"
+
+    try:
+        blocks: list[TextContent] = []
+        async with _http.stream("GET", "/todos", params=params) as response:
+            response.raise_for_status()
+            total = response.headers.get("x-total-count")
+            async for line in response.aiter_lines():
+                if line:
+                    text = format_todo(_loads(line))
+                    if blocks:
+                        text = f"\n---\n{text}"
+                    blocks.append(TextContent(type="text", text=text))
+    except httpx.HTTPError as e:
+        return [TextContent(type="text", text=f"Failed to list todos: API request failed: {str(e)}")]
+    except Exception as e:
+        return [TextContent(type="text", text=f"Failed to list todos: Unexpected error: {str(e)}")]
+
+    if not blocks:
+        return [TextContent(type="text", text="No todos found matching the criteria.")]
+
+    header = f"Found {total or len(blocks)} todo(s):\n{_HEADER_RULE}\n"
+    return [TextContent(type="text", text=header)] + blocks
 
 
 @mcp.tool()
@@ -139,12 +203,12 @@ async def get_todo(todo_id: int) -> str:
     Args:
         todo_id: The ID of the todo to retrieve
     """
-    result = await make_api_request("GET", f"/todos/{todo_id}")
-    
-    if result and "error" not in result:
+    ok, result = await make_api_request("GET", f"/todos/{todo_id}")
+
+    if ok:
         return format_todo(result)
-    
-    return f"Failed to get todo: {result.get('error', 'Todo not found')}"
+
+    return f"Failed to get todo: {result}"
 
 
 @mcp.tool()
@@ -162,8 +226,8 @@ async def update_todo(
         description: New description (optional)
         priority: New priority level - low, medium, high, or urgent (optional)
     """
-    if priority and priority not in ["low", "medium", "high", "urgent"]:
-        return f"Error: Invalid priority '{priority}'. Must be one of: low, medium, high, urgent"
+    if priority and priority not in VALID_PRIORITIES:
+        return _PRIORITY_ERROR.format(priority)
     
     # Build update data with only provided fields
     update_data = {}
@@ -177,12 +241,12 @@ async def update_todo(
     if not update_data:
         return "Error: No fields provided to update. Please specify at least one field."
     
-    result = await make_api_request("PUT", f"/todos/{todo_id}", json_data=update_data)
-    
-    if result and "error" not in result:
+    ok, result = await make_api_request("PUT", f"/todos/{todo_id}", json_data=update_data)
+
+    if ok:
         return f"✓ Todo updated successfully!\n{format_todo(result)}"
-    
-    return f"Failed to update todo: {result.get('error', 'Todo not found')}"
+
+    return f"Failed to update todo: {result}"
 
 
 @mcp.tool()
@@ -192,12 +256,12 @@ async def complete_todo(todo_id: int) -> str:
     Args:
         todo_id: The ID of the todo to mark as completed
     """
-    result = await make_api_request("PATCH", f"/todos/{todo_id}/complete")
-    
-    if result and "error" not in result:
+    ok, result = await make_api_request("PATCH", f"/todos/{todo_id}/complete")
+
+    if ok:
         return f"✓ Todo marked as completed!\n{format_todo(result)}"
-    
-    return f"Failed to complete todo: {result.get('error', 'Todo not found')}"
+
+    return f"Failed to complete todo: {result}"
 
 
 @mcp.tool()
@@ -207,28 +271,37 @@ async def delete_todo(todo_id: int) -> str:
     Args:
         todo_id: The ID of the todo to delete
     """
-    result = await make_api_request("DELETE", f"/todos/{todo_id}")
-    
-    if result and "error" not in result:
+    ok, result = await make_api_request("DELETE", f"/todos/{todo_id}")
+
+    if ok:
         return f"✓ Todo {todo_id} deleted successfully!"
-    
-    return f"Failed to delete todo: {result.get('error', 'Todo not found')}"
+
+    return f"Failed to delete todo: {result}"
 
 
 @mcp.tool()
 async def get_priorities() -> str:
     """Get the list of available priority levels for todos."""
-    result = await make_api_request("GET", "/priorities")
-    
-    if result and "error" not in result:
+    ok, result = await make_api_request("GET", "/priorities")
+
+    if ok:
         priorities = result.get("priorities", [])
         return f"Available priority levels: {', '.join(priorities)}"
-    
-    return f"Failed to get priorities: {result.get('error', 'Unknown error')}"
+
+    return f"Failed to get priorities: {result}"
 
 
 def main():
     """Initialize and run the MCP server."""
+    try:
+        # Optional: uvloop is a drop-in event loop with lower per-op
+        # syscall cost; the server is pure async I/O, so loop throughput
+        # bounds the tool-call rate. Install with the "perf" extra.
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     mcp.run(transport="stdio")
 
 
@@ -25,45 +25,55 @@ import httpx
 TODO_API_BASE = "http://localhost:8000/api"
 DEFAULT_TIMEOUT = 30.0
 
+# Prebuilt per-todo display template; filled via str.format_map so each row
+# costs one format call instead of a multi-line f-string plus .strip()
+_TODO_FMT = "ID: {id}\nTitle: {title}\nStatus: {_status}\nPriority: {_prio}"
+
+# Display forms precomputed once; a 4-entry lookup replaces an .upper()
+# call per formatted row
+_PRIO_DISPLAY = {p: p.upper() for p in ("low", "medium", "high", "urgent")}
+_HEADER_RULE = "=" * 50
+
+# One async HTTP client shared by all requests. Reusing a single client
+# keeps connections alive between tool calls instead of paying a new TCP
+# handshake per request - endpoints are resolved relative to base_url.
+_http = httpx.AsyncClient(base_url=TODO_API_BASE, timeout=DEFAULT_TIMEOUT)
+
 
 async def make_api_request(
-    method: str, 
-    endpoint: str, 
+    method: str,
+    endpoint: str,
     params: dict[str, Any] | None = None
 ) -> dict[str, Any] | None:
     """Make a request to the Todo API with proper error handling.
-    
+
     This helper function handles all HTTP communication with the Todo API.
-    It uses httpx for async HTTP requests and includes error handling.
-    
+    It uses the shared httpx client above, so requests reuse pooled
+    connections, and includes error handling.
+
     Args:
         method: HTTP method (GET, POST, etc.)
         endpoint: API endpoint path (e.g., "/todos")
         params: Optional query parameters
-        
+
     Returns:
         dict with the API response, or dict with "error" key if request failed
     """
-    # TODO: Build the full URL by combining TODO_API_BASE and endpoint
-    # HINT: url = f"{_____}{_____}"
-    
-    # Create an async HTTP client and make the request
-    async with httpx.AsyncClient() as client:
-        try:
-            # TODO: Make the HTTP request using client.request()
-            # HINT: Pass method, url, params, and timeout
-            # response = await client.request(...)
-            
-            # TODO: Raise an exception if the response status is an error
-            # HINT: response.raise_for_status()
-            
-            # TODO: Return the JSON response
-            # HINT: return response._____()
-            
-        except httpx.HTTPError as e:
-            return {"error": f"API request failed: {str(e)}"}
-        except Exception as e:
-            return {"error": f"Unexpected error: {str(e)}"}
+    try:
+        # TODO: Make the HTTP request using the shared client's request()
+        # HINT: Pass method, endpoint (as the url), and params
+        # response = await _http.request(...)
+
+        # TODO: Raise an exception if the response status is an error
+        # HINT: response.raise_for_status()
+
+        # TODO: Return the JSON response
+        # HINT: return response._____()
+
+    except httpx.HTTPError as e:
+        return {"error": f"API request failed: {str(e)}"}
+    except Exception as e:
+        return {"error": f"Unexpected error: {str(e)}"}
 
 
 # TODO: Add the @mcp.tool() decorator to register this function as an MCP tool
@@ -117,23 +127,19 @@ async def list_todos(
         if not todos:
             return "No todos found matching the criteria."
         
-        # Format todos for display
-        output = [f"Found {total} todo(s):\n" + "=" * 50]
-        
+        # Format todos for display using the prebuilt template
+        rows = []
         for todo in todos:
-            # TODO: Set status to "✓ Completed" if completed, else "○ Active"
-            # HINT: status = "✓ Completed" if todo.get(_____) else "○ Active"
-            
-            # Format each todo with its details
-            output.append(f"""
-ID: {todo['id']}
-Title: {todo['title']}
-Status: {status}
-Priority: {todo['priority'].upper()}
-""".strip())
-        
-        # TODO: Join all output strings with separator "\n---\n"
-        # HINT: return "\n---\n"._____(output)
+            # TODO: Set todo["_status"] to "✓ Completed" if completed, else "○ Active"
+            # HINT: todo["_status"] = "✓ Completed" if todo.get(_____) else "○ Active"
+
+            todo["_prio"] = _PRIO_DISPLAY[todo["priority"]]
+            rows.append(_TODO_FMT.format_map(todo))
+
+        # TODO: Join the formatted rows with separator "\n---\n"
+        # HINT: body = "\n---\n"._____(rows)
+
+        return f"Found {total} todo(s):\n{_HEADER_RULE}\n---\n{body}"
     
     # Return error message if request failed
     return f"Failed to list todos: {result.get('error', 'Unknown error')}"
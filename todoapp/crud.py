@@ -1,129 +1,219 @@
 """CRUD operations for Todo items."""
 
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from typing import Optional, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from sqlalchemy import and_, delete, func, select, update
 from .models import Todo, Priority
 from .schemas import TodoCreate, TodoUpdate
 
 
-def create_todo(db: Session, todo: TodoCreate) -> Todo:
+def _build_filters(
+    priority: Optional[str] = None,
+    completed: Optional[bool] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    cursor: Optional[int] = None
+) -> List:
+    """Build the list of filter expressions shared by the todo queries."""
+    filters = []
+    if priority is not None:
+        filters.append(Todo.priority == priority)
+    if completed is not None:
+        filters.append(Todo.completed == completed)
+    if created_after is not None:
+        filters.append(Todo.created_at >= created_after)
+    if created_before is not None:
+        filters.append(Todo.created_at <= created_before)
+    if cursor is not None:
+        # Keyset pagination: rows strictly older than the last-seen id,
+        # walked via the index instead of scanning past an OFFSET. The id
+        # stands in for (created_at, id) because created_at never
+        # decreases across inserts, and it stays unique where the
+        # second-precision timestamps tie.
+        filters.append(Todo.id < cursor)
+    return filters
+
+
+# Column projection for list queries: everything the list consumers (the
+# frontend and the MCP servers) actually render. Only updated_at is dead
+# weight in list responses, so it alone stays deferred.
+_LIST_COLUMNS = load_only(
+    Todo.id,
+    Todo.title,
+    Todo.description,
+    Todo.priority,
+    Todo.completed,
+    Todo.created_at,
+    Todo.completed_at,
+)
+
+
+async def create_todo(db: AsyncSession, todo: TodoCreate) -> Todo:
     """Create a new todo item."""
     db_todo = Todo(
         title=todo.title,
         description=todo.description,
-        priority=todo.priority
+        priority=todo.priority.value
     )
     db.add(db_todo)
-    db.commit()
-    db.refresh(db_todo)
+    await db.commit()
+    await db.refresh(db_todo)
     return db_todo
 
 
-def get_todo(db: Session, todo_id: int) -> Optional[Todo]:
-    """Get a single todo by ID."""
-    return db.query(Todo).filter(Todo.id == todo_id).first()
+async def get_todo(db: AsyncSession, todo_id: int) -> Optional[Todo]:
+    """Get a single todo by ID.
+
+    Session.get consults the identity map first, so a row already loaded
+    in this session is returned without emitting SQL.
+    """
+    return await db.get(Todo, todo_id)
 
 
-def get_todos(
-    db: Session,
+async def get_todos(
+    db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
-    priority: Optional[Priority] = None,
+    priority: Optional[str] = None,
     completed: Optional[bool] = None,
     created_after: Optional[datetime] = None,
-    created_before: Optional[datetime] = None
+    created_before: Optional[datetime] = None,
+    cursor: Optional[int] = None
 ) -> List[Todo]:
     """Get todos with optional filters."""
-    query = db.query(Todo)
-    
-    # Apply filters
-    filters = []
-    if priority is not None:
-        filters.append(Todo.priority == priority)
-    if completed is not None:
-        filters.append(Todo.completed == completed)
-    if created_after is not None:
-        filters.append(Todo.created_at >= created_after)
-    if created_before is not None:
-        filters.append(Todo.created_at <= created_before)
-    
+    stmt = select(Todo).options(_LIST_COLUMNS)
+
+    filters = _build_filters(priority, completed, created_after, created_before, cursor)
     if filters:
-        query = query.filter(and_(*filters))
-    
-    # Order by created_at descending (newest first)
-    query = query.order_by(Todo.created_at.desc())
-    
-    return query.offset(skip).limit(limit).all()
+        stmt = stmt.where(and_(*filters))
+
+    # Order by created_at descending (newest first), id breaking ties so
+    # pagination is stable when timestamps collide
+    stmt = stmt.order_by(Todo.created_at.desc(), Todo.id.desc())
+
+    if cursor is None:
+        # OFFSET only applies to the legacy skip-based paging; a cursor
+        # already positions the page
+        stmt = stmt.offset(skip)
 
+    result = await db.execute(stmt.limit(limit))
+    return list(result.scalars().all())
 
-def get_todos_count(
-    db: Session,
-    priority: Optional[Priority] = None,
+
+async def get_todos_count(
+    db: AsyncSession,
+    priority: Optional[str] = None,
     completed: Optional[bool] = None,
     created_after: Optional[datetime] = None,
-    created_before: Optional[datetime] = None
+    created_before: Optional[datetime] = None,
+    cursor: Optional[int] = None
 ) -> int:
-    """Count todos with optional filters."""
-    query = db.query(Todo)
-    
+    """Count todos with optional filters.
+
+    With a cursor, counts only the rows remaining from the cursor
+    onwards - the same semantics as get_todos_with_total.
+    """
+    stmt = select(func.count()).select_from(Todo)
+
     # Apply same filters as get_todos
-    filters = []
-    if priority is not None:
-        filters.append(Todo.priority == priority)
-    if completed is not None:
-        filters.append(Todo.completed == completed)
-    if created_after is not None:
-        filters.append(Todo.created_at >= created_after)
-    if created_before is not None:
-        filters.append(Todo.created_at <= created_before)
-    
+    filters = _build_filters(priority, completed, created_after, created_before, cursor)
+    if filters:
+        stmt = stmt.where(and_(*filters))
+
+    return (await db.execute(stmt)).scalar_one()
+
+
+async def get_todos_with_total(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    priority: Optional[str] = None,
+    completed: Optional[bool] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    cursor: Optional[int] = None
+) -> Tuple[List[Todo], int]:
+    """Get a page of todos plus the total match count in a single query.
+
+    A count(*) OVER () window attaches the grand total to every returned
+    row, so the list endpoint pays one database round trip instead of the
+    separate SELECT + COUNT pair. With a cursor, the total counts the
+    rows remaining from the cursor onwards.
+    """
+    filters = _build_filters(priority, completed, created_after, created_before, cursor)
+
+    stmt = select(Todo, func.count().over().label("total")).options(_LIST_COLUMNS)
     if filters:
-        query = query.filter(and_(*filters))
-    
-    return query.count()
+        stmt = stmt.where(and_(*filters))
+    stmt = stmt.order_by(Todo.created_at.desc(), Todo.id.desc())
+    if cursor is None:
+        stmt = stmt.offset(skip)
+    stmt = stmt.limit(limit)
+
+    rows = (await db.execute(stmt)).all()
+    if rows:
+        return [row[0] for row in rows], rows[0][1]
+
+    if skip:
+        # The page ran past the end of the result set, so no row carried
+        # the window total; fall back to a count for the true figure
+        return [], await get_todos_count(
+            db,
+            priority=priority,
+            completed=completed,
+            created_after=created_after,
+            created_before=created_before
+        )
+
+    return [], 0
 
 
-def update_todo(db: Session, todo_id: int, todo_update: TodoUpdate) -> Optional[Todo]:
+async def update_todo(db: AsyncSession, todo_id: int, todo_update: TodoUpdate) -> Optional[Todo]:
     """Update a todo item."""
-    db_todo = get_todo(db, todo_id)
-    if not db_todo:
-        return None
-    
-    # Update only provided fields
-    update_data = todo_update.model_dump(exclude_unset=True)
-    
-    for field, value in update_data.items():
-        setattr(db_todo, field, value)
-    
-    db_todo.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(db_todo)
+    # Update only the fields the caller actually sent. Reading
+    # __pydantic_fields_set__ directly skips model_dump's full serializer
+    # walk over the model.
+    update_data = {
+        field: getattr(todo_update, field)
+        for field in todo_update.__pydantic_fields_set__
+    }
+    if isinstance(update_data.get("priority"), Priority):
+        # The column is a plain string; store the enum's value
+        update_data["priority"] = update_data["priority"].value
+    update_data["updated_at"] = datetime.utcnow()
+
+    # Single UPDATE .. RETURNING round trip instead of SELECT, UPDATE,
+    # then a refresh SELECT
+    stmt = (
+        update(Todo)
+        .where(Todo.id == todo_id)
+        .values(**update_data)
+        .returning(Todo)
+    )
+    db_todo = (await db.execute(stmt)).scalar_one_or_none()
+    await db.commit()
     return db_todo
 
 
-def complete_todo(db: Session, todo_id: int) -> Optional[Todo]:
+async def complete_todo(db: AsyncSession, todo_id: int) -> Optional[Todo]:
     """Mark a todo as completed."""
-    db_todo = get_todo(db, todo_id)
-    if not db_todo:
-        return None
-    
-    db_todo.completed = True
-    db_todo.completed_at = datetime.utcnow()
-    db_todo.updated_at = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(db_todo)
+    now = datetime.utcnow()
+    stmt = (
+        update(Todo)
+        .where(Todo.id == todo_id)
+        .values(completed=True, completed_at=now, updated_at=now)
+        .returning(Todo)
+    )
+    db_todo = (await db.execute(stmt)).scalar_one_or_none()
+    await db.commit()
     return db_todo
 
 
-def delete_todo(db: Session, todo_id: int) -> bool:
+async def delete_todo(db: AsyncSession, todo_id: int) -> bool:
     """Delete a todo item."""
-    db_todo = get_todo(db, todo_id)
-    if not db_todo:
-        return False
-    
-    db.delete(db_todo)
-    db.commit()
-    return True
+    stmt = delete(Todo).where(Todo.id == todo_id).returning(Todo.id)
+    deleted_id = (await db.execute(stmt)).scalar_one_or_none()
+    await db.commit()
+    return deleted_id is not None
@@ -1,31 +1,31 @@
 """Database connection and session management."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from .models import Base
 
 # SQLite database URL - creates file in the todoapp directory
-SQLALCHEMY_DATABASE_URL = "sqlite:///./todoapp/todos.db"
-
-# Create engine with check_same_thread=False for SQLite
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, 
-    connect_args={"check_same_thread": False}
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./todoapp/todos.db"
+
+# Async engine: requests await the database instead of occupying a thread
+# in FastAPI's threadpool for the duration of each query
+engine = create_async_engine(SQLALCHEMY_DATABASE_URL)
+
+# Create SessionLocal class. expire_on_commit=False keeps rows returned by
+# UPDATE/INSERT .. RETURNING usable after commit without a re-SELECT.
+SessionLocal = async_sessionmaker(
+    engine,
+    autoflush=False,
+    expire_on_commit=False,
 )
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
 
-def init_db():
+async def init_db():
     """Initialize the database, creating all tables."""
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 
-def get_db():
+async def get_db():
     """Dependency to get database session."""
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
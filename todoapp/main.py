@@ -1,20 +1,22 @@
 """FastAPI application for Todo management."""
 
+import asyncio
 from datetime import datetime
 from typing import Optional
 from fastapi import FastAPI, Depends, HTTPException, Query
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from pathlib import Path
 
 from . import crud
-from .database import get_db, init_db
+from .database import SessionLocal, get_db, init_db
 from .models import Priority
 from .schemas import (
     TodoCreate,
     TodoUpdate,
     TodoResponse,
+    TodoListItem,
     TodoListResponse,
     MessageResponse,
     PriorityResponse
@@ -29,8 +31,8 @@ app = FastAPI(
 
 # Initialize database on startup
 @app.on_event("startup")
-def startup_event():
-    init_db()
+async def startup_event():
+    await init_db()
 
 
 # Mount static files
@@ -47,72 +49,142 @@ async def read_root():
 
 # API Endpoints
 @app.post("/api/todos", response_model=TodoResponse, status_code=201)
-def create_todo(todo: TodoCreate, db: Session = Depends(get_db)):
+async def create_todo(todo: TodoCreate, db: AsyncSession = Depends(get_db)):
     """Create a new todo item."""
-    return crud.create_todo(db, todo)
+    return await crud.create_todo(db, todo)
 
 
 @app.get("/api/todos", response_model=TodoListResponse)
-def list_todos(
+async def list_todos(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of items to return"),
     priority: Optional[Priority] = Query(None, description="Filter by priority"),
     completed: Optional[bool] = Query(None, description="Filter by completion status"),
     created_after: Optional[datetime] = Query(None, description="Filter by creation date (after)"),
     created_before: Optional[datetime] = Query(None, description="Filter by creation date (before)"),
-    db: Session = Depends(get_db)
+    cursor: Optional[int] = Query(None, description="Keyset pagination: return todos older than this id (use next_cursor from the previous page; overrides skip)"),
+    format: Optional[str] = Query(None, description="Set to 'ndjson' to stream one todo per line"),
+    db: AsyncSession = Depends(get_db)
 ):
     """List todos with optional filters."""
-    todos = crud.get_todos(
-        db,
-        skip=skip,
-        limit=limit,
-        priority=priority,
-        completed=completed,
-        created_after=created_after,
-        created_before=created_before
-    )
-    total = crud.get_todos_count(
-        db,
-        priority=priority,
-        completed=completed,
-        created_after=created_after,
-        created_before=created_before
-    )
-    return TodoListResponse(todos=todos, total=total)
+    if format == "ndjson":
+        # The streaming path skips the count(*) OVER () fusion - the window
+        # total would ride along on every row.
+        if skip == 0 and cursor is None:
+            # Unpaginated first page: if it comes back short, the page IS
+            # the full result set and the count query is skipped entirely
+            todos = await crud.get_todos(
+                db,
+                limit=limit,
+                priority=priority.value if priority else None,
+                completed=completed,
+                created_after=created_after,
+                created_before=created_before
+            )
+            if len(todos) < limit:
+                total = len(todos)
+            else:
+                total = await crud.get_todos_count(
+                    db,
+                    priority=priority.value if priority else None,
+                    completed=completed,
+                    created_after=created_after,
+                    created_before=created_before
+                )
+        else:
+            # Deeper pages always need the count, so overlap it with the
+            # row fetch on a second pooled session - one async session
+            # cannot run two statements at once
+            async with SessionLocal() as count_db:
+                todos, total = await asyncio.gather(
+                    crud.get_todos(
+                        db,
+                        skip=skip,
+                        limit=limit,
+                        priority=priority.value if priority else None,
+                        completed=completed,
+                        created_after=created_after,
+                        created_before=created_before,
+                        cursor=cursor
+                    ),
+                    crud.get_todos_count(
+                        count_db,
+                        priority=priority.value if priority else None,
+                        completed=completed,
+                        created_after=created_after,
+                        created_before=created_before,
+                        # cursor-inclusive, matching the JSON path's
+                        # window-fused total for the same query
+                        cursor=cursor
+                    )
+                )
+    else:
+        todos, total = await crud.get_todos_with_total(
+            db,
+            skip=skip,
+            limit=limit,
+            priority=priority.value if priority else None,
+            completed=completed,
+            created_after=created_after,
+            created_before=created_before,
+            cursor=cursor
+        )
+
+    # Cursor for the next page; a short page means the results are exhausted
+    next_cursor = todos[-1].id if len(todos) == limit else None
+
+    if format == "ndjson":
+        # Stream one JSON-encoded todo per line so clients can process
+        # items as they arrive instead of buffering the whole payload.
+        # The total count travels in a header since there is no envelope.
+        def generate():
+            for todo in todos:
+                yield TodoListItem.model_validate(todo).model_dump_json() + "\n"
+
+        headers = {"X-Total-Count": str(total)}
+        if next_cursor is not None:
+            headers["X-Next-Cursor"] = str(next_cursor)
+
+        return StreamingResponse(
+            generate(),
+            media_type="application/x-ndjson",
+            headers=headers
+        )
+
+    return TodoListResponse(todos=todos, total=total, next_cursor=next_cursor)
 
 
 @app.get("/api/todos/{todo_id}", response_model=TodoResponse)
-def get_todo(todo_id: int, db: Session = Depends(get_db)):
+async def get_todo(todo_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific todo by ID."""
-    todo = crud.get_todo(db, todo_id)
+    todo = await crud.get_todo(db, todo_id)
     if not todo:
         raise HTTPException(status_code=404, detail="Todo not found")
     return todo
 
 
 @app.put("/api/todos/{todo_id}", response_model=TodoResponse)
-def update_todo(todo_id: int, todo_update: TodoUpdate, db: Session = Depends(get_db)):
+async def update_todo(todo_id: int, todo_update: TodoUpdate, db: AsyncSession = Depends(get_db)):
     """Update a todo item."""
-    todo = crud.update_todo(db, todo_id, todo_update)
+    todo = await crud.update_todo(db, todo_id, todo_update)
     if not todo:
         raise HTTPException(status_code=404, detail="Todo not found")
     return todo
 
 
 @app.patch("/api/todos/{todo_id}/complete", response_model=TodoResponse)
-def complete_todo(todo_id: int, db: Session = Depends(get_db)):
+async def complete_todo(todo_id: int, db: AsyncSession = Depends(get_db)):
     """Mark a todo as completed."""
-    todo = crud.complete_todo(db, todo_id)
+    todo = await crud.complete_todo(db, todo_id)
     if not todo:
         raise HTTPException(status_code=404, detail="Todo not found")
     return todo
 
 
 @app.delete("/api/todos/{todo_id}", response_model=MessageResponse)
-def delete_todo(todo_id: int, db: Session = Depends(get_db)):
+async def delete_todo(todo_id: int, db: AsyncSession = Depends(get_db)):
     """Delete a todo item."""
-    success = crud.delete_todo(db, todo_id)
+    success = await crud.delete_todo(db, todo_id)
     if not success:
         raise HTTPException(status_code=404, detail="Todo not found")
     return MessageResponse(message=f"Todo {todo_id} deleted successfully")
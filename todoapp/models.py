@@ -1,8 +1,7 @@
 """SQLAlchemy models for the Todo application."""
 
-from datetime import datetime
 from enum import Enum as PyEnum
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, CheckConstraint, Index, func
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -20,15 +19,32 @@ class Todo(Base):
     """Todo item model."""
     
     __tablename__ = "todos"
-    
+
+    __table_args__ = (
+        # Matches the list query shape: equality filters on completed and
+        # priority, ordered by created_at (index scans run backwards for
+        # the DESC ordering)
+        Index("ix_todos_completed_priority_created_at", "completed", "priority", "created_at"),
+        # Serves the unfiltered newest-first listing
+        Index("ix_todos_created_at", "created_at"),
+        # The database still rejects bad values; validation of API input
+        # stays in the Pydantic/Query layer
+        CheckConstraint("priority IN ('low', 'medium', 'high', 'urgent')"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     description = Column(String, nullable=True)
-    priority = Column(Enum(Priority), default=Priority.MEDIUM, nullable=False)
+    # Plain string column: SQLite stores the enum as text either way, and
+    # skipping SQLAlchemy's Enum adapter avoids a Python-level coercion on
+    # every row fetched
+    priority = Column(String(16), default=Priority.MEDIUM.value, nullable=False)
     completed = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # func.now() lets the database stamp rows itself, so inserts don't
+    # construct Python datetimes at all
+    created_at = Column(DateTime, default=func.now(), nullable=False)
     completed_at = Column(DateTime, nullable=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
     
     def __repr__(self):
-        return f"<Todo(id={self.id}, title='{self.title}', priority={self.priority.value}, completed={self.completed})>"
+        return f"<Todo(id={self.id}, title='{self.title}', priority={self.priority}, completed={self.completed})>"
@@ -38,10 +38,30 @@ class TodoResponse(TodoBase):
         from_attributes = True
 
 
+class TodoListItem(TodoBase):
+    """Slim todo schema for list responses.
+
+    Omits updated_at, the one column list consumers never render, which
+    matches the load_only projection in crud and keeps the deferred column
+    from being lazily re-fetched during serialization.
+    """
+    id: int
+    completed: bool
+    created_at: datetime
+    completed_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
 class TodoListResponse(BaseModel):
     """Schema for list of todos."""
-    todos: list[TodoResponse]
+    todos: list[TodoListItem]
     total: int
+    # Keyset-pagination cursor (id of the last todo on this page): pass
+    # back as ?cursor= to fetch the next page; None when this page
+    # exhausted the results
+    next_cursor: Optional[int] = None
 
 
 class MessageResponse(BaseModel):